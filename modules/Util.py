@@ -1,4 +1,5 @@
 import os
+import sys
 import subprocess
 import shlex
 import shutil
@@ -25,14 +26,18 @@ def run_command(cmd, join_stderr=True, shell_cmd=False, verbose=True, cwd=None):
     P = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_setting,
         bufsize=0, cwd=current_wd, shell=shell_cmd)
     out = []
-    while P.poll() is None:
-        read = P.stdout.readline().rstrip()
-        decoded_str = read.decode('utf-8')
+    # stream output line by line until EOF so long running commands
+    # (e.g. conda downloads) are echoed as they progress and nothing
+    # still buffered when the process exits gets dropped.
+    for read in iter(P.stdout.readline, b''):
+        decoded_str = read.rstrip().decode('utf-8')
         out.append(decoded_str)
         if verbose == True:
             print(decoded_str)
+            sys.stdout.flush()
+    P.stdout.close()
 
-    ret_code = P.returncode
+    ret_code = P.wait()
     return(ret_code, out)
                                                                                               
 def run_cmd(cmd, join_stderr=True, shell_cmd=False, verbose=True, cwd=None):